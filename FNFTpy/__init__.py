@@ -27,10 +27,10 @@ Christoph Mahnke, 2018
 
 """
 
-from .auxiliary import get_lib_path, get_fnft_version, print_fnft_version
+from .auxiliary import get_lib_path, get_fnft_clib, get_fnft_version, print_fnft_version
 
 # import wrapper functions
-from .fnft_kdvv_wrapper import kdvv_wrapper, kdvv
+from .fnft_kdvv_wrapper import kdvv_wrapper, kdvv, kdvv_batch, kdvv_parallel
 from .fnft_nsep_wrapper import nsep_wrapper, nsep
 from .fnft_nsev_wrapper import nsev_wrapper, nsev
 from .fnft_nsev_inverse_wrapper import nsev_inverse_xi_wrapper, nsev_inverse_wrapper, nsev_inverse
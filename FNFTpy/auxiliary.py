@@ -26,6 +26,7 @@ Contributors:
 Christoph Mahnke, 2018
 
 """
+from functools import lru_cache
 from warnings import warn
 from .typesdef import *
 
@@ -50,6 +51,22 @@ def get_lib_path():
     return libstr
 
 
+@lru_cache(maxsize=None)
+def get_fnft_clib():
+    """Return the FNFT library located at get_lib_path(), loaded with ctypes.
+
+    The library is loaded on first use only, subsequent calls return the same handle.
+    Functions whose argtypes are set on each call should be fetched by item access,
+    e.g. get_fnft_clib()['fnft_nsev'], which returns a new function object every time.
+
+    Returns:
+
+    * fnft_clib : ctypes.CDLL handle of the FNFT library
+
+    """
+    return ctypes.CDLL(get_lib_path())
+
+
 def get_fnft_version():
     """
     Get the version of FNFT used by calling fnft_version.
@@ -65,8 +82,8 @@ def get_fnft_version():
 
     """
     suffix_maxlen = 8  # defined in  FNFT/include/fnft_config.h.in
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_versionf = fnft_clib.fnft_version
+    fnft_clib = get_fnft_clib()
+    clib_versionf = fnft_clib['fnft_version']
     clib_versionf.restype = ctypes_int
     version_major = ctypes_uint(0)
     version_minor = ctypes_uint(0)
@@ -125,6 +142,51 @@ def check_value(val, vmin, vmax, vtype=int):
         raise ValueError("Value Error: variable out of range")
 
 
+def prepare_input_array(inp, size):
+    """Return the input as C-contiguous complex array. Raise ValueError when its length does not match.
+
+    Arguments:
+
+    * inp : numpy array holding the samples passed to FNFT
+    * size : number of samples FNFT will read
+
+    Returns:
+
+    * arr : inp itself if it is a C-contiguous complex array already, else a converted copy
+
+    """
+    arr = np.ascontiguousarray(inp, dtype=numpy_complex)
+    if arr.shape != (size,):
+        raise ValueError("Input array mismatch: expected 1-d array of length {}, got shape {}".format(
+            size, arr.shape))
+    return arr
+
+
+def prepare_output_array(out, shape):
+    """Return an array to be filled by FNFT. Raise ValueError when a passed array is not suitable.
+
+    Arguments:
+
+    * out : numpy array to be reused as output buffer or None
+    * shape : shape (or number of elements for 1-d arrays) the output array must have
+
+    Returns:
+
+    * out : uninitialized complex array of given shape if out is None, else out itself
+
+    """
+    if np.isscalar(shape):
+        shape = (shape,)
+    shape = tuple(shape)
+    if out is None:
+        return np.empty(shape, dtype=numpy_complex)
+    if (out.dtype != numpy_complex or not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']
+            or out.shape != shape):
+        raise ValueError("Output array mismatch: expected writeable C-contiguous {} array of shape {}".format(
+            np.dtype(numpy_complex), shape))
+    return out
+
+
 def check_return_code(rv):
     """Check the return code of a library call. Give warning if Code is not 0.
 
@@ -27,12 +27,15 @@ Christoph Mahnke, 2018
 
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from .typesdef import *
 from .options_handling import get_kdvv_options
-from .auxiliary import get_lib_path, check_return_code
+from .auxiliary import get_fnft_clib, check_return_code, prepare_input_array, prepare_output_array
 
 
-def kdvv(u, tvec, M=128, Xi1=-2, Xi2=2, dis=None):
+def kdvv(u, tvec, M=128, Xi1=-2, Xi2=2, dis=None, out=None):
     """Calculate the Nonlinear Fourier Transform for the Korteweg-de Vries equation with vanishing boundaries.
 
     This function is intended to be 'convenient', which means it
@@ -48,7 +51,7 @@ def kdvv(u, tvec, M=128, Xi1=-2, Xi2=2, dis=None):
     Arguments:
 
     * u : numpy array holding the samples of the field to be analyzed
-    * tvec : time vector
+    * tvec : time vector in ascending order, its first and last entry are passed as T1 and T2
     * M : number of samples for the continuous spectrum to calculate,
 
     Optional arguments:
@@ -75,6 +78,8 @@ def kdvv(u, tvec, M=128, Xi1=-2, Xi2=2, dis=None):
         * 16 = 2split8a
         * 17 = 2split8b
 
+    * out : complex numpy array of length M to store the continuous spectrum in, default = None (allocate new array)
+
     Returns:
 
     * rdict : dictionary holding the fields:
@@ -87,15 +92,143 @@ def kdvv(u, tvec, M=128, Xi1=-2, Xi2=2, dis=None):
 
     D = len(u)
     K = 0  # not yet implemented
-    T1 = np.min(tvec)
-    T2 = np.max(tvec)
+    T1 = tvec[0]
+    T2 = tvec[-1]
     options = get_kdvv_options(dis=dis)
     return kdvv_wrapper(D, u, T1, T2, M, Xi1, Xi2,
-                        K, options)
+                        K, options, out=out)
+
+
+def kdvv_batch(us, tvec, M=128, Xi1=-2, Xi2=2, dis=None, out=None):
+    """Calculate the Nonlinear Fourier Transform for the Korteweg-de Vries equation for several signals.
+
+    All signals share the same time vector and options. Compared to calling 'kdvv' for each signal,
+    the conversion of the input and the setup of the call to FNFT are done only once.
+
+    Currently, only the continuous spectrum is calculated.
+
+    Arguments:
+
+    * us : numpy array of shape (N, D) holding N fields with D samples each
+    * tvec : time vector in ascending order, its first and last entry are passed as T1 and T2
+
+    Optional arguments:
+
+    * M : number of samples for the continuous spectrum to calculate, default = 128
+    * Xi1, Xi2 : min and max frequency for the continuous spectrum, default = [-2,2]
+    * dis : determines the discretization, default = 17 (see 'kdvv' for possible values)
+    * out : C-contiguous complex numpy array of shape (N, M) to store the continuous spectra in,
+      default = None (allocate new array)
+
+    Returns:
+
+    * rdict : dictionary holding the fields:
+
+        * return_value : array of return values from FNFT, one for each field
+        * cont : continuous spectra, array of shape (N, M)
+        * options : KdvvOptionsStruct with options used
+
+    """
+
+    return _kdvv_rows(us, tvec, M, Xi1, Xi2, dis, out, map)
+
+
+def kdvv_parallel(us, tvec, M=128, Xi1=-2, Xi2=2, dis=None, out=None, n_workers=None):
+    """Calculate the Nonlinear Fourier Transform for the Korteweg-de Vries equation for several signals in parallel.
+
+    Works like 'kdvv_batch', but the signals are distributed over a pool of threads.
+    ctypes releases the GIL while FNFT is running, so the calculations run
+    concurrently on multiple cores. Each signal is written to its own row of the output array.
+
+    Arguments:
+
+    * us : numpy array of shape (N, D) holding N fields with D samples each
+    * tvec : time vector in ascending order, its first and last entry are passed as T1 and T2
+
+    Optional arguments:
+
+    * M : number of samples for the continuous spectrum to calculate, default = 128
+    * Xi1, Xi2 : min and max frequency for the continuous spectrum, default = [-2,2]
+    * dis : determines the discretization, default = 17 (see 'kdvv' for possible values)
+    * out : C-contiguous complex numpy array of shape (N, M) to store the continuous spectra in,
+      default = None (allocate new array)
+    * n_workers : number of threads, default = None (number of CPUs)
+
+    Returns:
+
+    * rdict : dictionary holding the fields:
+
+        * return_value : array of return values from FNFT, one for each field
+        * cont : continuous spectra, array of shape (N, M)
+        * options : KdvvOptionsStruct with options used
+
+    """
+
+    if n_workers is None:
+        n_workers = os.cpu_count()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return _kdvv_rows(us, tvec, M, Xi1, Xi2, dis, out, executor.map)
+
+
+def _kdvv_rows(us, tvec, M, Xi1, Xi2, dis, out, map_func):
+    """Call fnft_kdvv for each row of us, dispatching the calls with map_func."""
+    clib_kdvv_func = _get_kdvv_func()
+    kdvv_us = np.ascontiguousarray(us, dtype=numpy_complex)
+    if kdvv_us.ndim != 2:
+        raise ValueError("Input array mismatch: expected 2-d array of shape (N, D), got shape {}".format(
+            kdvv_us.shape))
+    N, D = kdvv_us.shape
+    kdvv_T = np.asarray([tvec[0], tvec[-1]], dtype=numpy_double)
+    kdvv_Xi = np.asarray([Xi1, Xi2], dtype=numpy_double)
+    kdvv_cont = prepare_output_array(out, (N, M))
+    options = get_kdvv_options(dis=dis)
+
+    def kdvv_row(i):
+        # rows of C-contiguous arrays are passed to FNFT without copying
+        return clib_kdvv_func(
+            D,
+            kdvv_us[i],
+            kdvv_T,
+            M,
+            kdvv_cont[i],
+            kdvv_Xi,
+            ctypes_nullptr,
+            ctypes_nullptr,
+            ctypes_nullptr,
+            ctypes.byref(options))
+
+    rv = np.fromiter(map_func(kdvv_row, range(N)), dtype=int, count=N)
+    for rvi in rv:
+        check_return_code(rvi)
+    rdict = {'return_value': rv, 'cont': kdvv_cont, 'options': options}
+    return rdict
+
+
+@lru_cache(maxsize=None)
+def _get_kdvv_func():
+    """Return the C-function 'fnft_kdvv' with restype and argtypes set.
+
+    The prototype is set up on first use only, subsequent calls return the cached function.
+    """
+    fnft_clib = get_fnft_clib()
+    clib_kdvv_func = fnft_clib.fnft_kdvv
+    clib_kdvv_func.restype = ctypes_int
+    clib_kdvv_func.argtypes = [
+        ctypes_uint,  # D
+        numpy_complex_arr_ptr,  # u
+        numpy_double_arr_ptr,  # t
+        ctypes_uint,  # M
+        numpy_complex_arr_ptr,  # cont
+        numpy_double_arr_ptr,  # Xi
+        type(ctypes_nullptr),  # K_ptr
+        type(ctypes_nullptr),  # boundstates
+        type(ctypes_nullptr),  # normconsts res
+        ctypes.POINTER(KdvvOptionsStruct)]  # options ptr
+    return clib_kdvv_func
 
 
 def kdvv_wrapper(D, u, T1, T2, M, Xi1, Xi2,
-                 K, options):
+                 K, options, out=None):
     """Calculate the Nonlinear Fourier Transform for the Korteweg-de Vries equation with vanishing boundaries.
 
     This function's interface mimics the behavior of the function 'fnft_kdvv' of FNFT.
@@ -107,13 +240,19 @@ def kdvv_wrapper(D, u, T1, T2, M, Xi1, Xi2,
     Arguments:
 
     * D : number of samples
-    * u : numpy array holding the samples of the field to be analyzed
+    * u : numpy array holding the samples of the field to be analyzed.
+      A C-contiguous complex128 array is passed to FNFT without copying.
     * T1, T2  : time positions of the first and the last sample
     * M : number of values for the continuous spectrum to calculate
     * Xi1, Xi2 : min and max frequency for the continuous spectrum
     * K : maximum number of bound states to calculate (no effect yet)
     * options : options for kdvv as KdvvOptionsStruct. Can be generated e.g. with 'get_kdvv_options()'
 
+    Optional arguments:
+
+    * out : C-contiguous complex numpy array of length M to store the continuous spectrum in.
+      Reusing the same array avoids an allocation per call. default = None (allocate new array)
+
     Returns:
 
     * rdict : dictionary holding the fields:
@@ -123,41 +262,16 @@ def kdvv_wrapper(D, u, T1, T2, M, Xi1, Xi2,
         * options : KdvvOptionsStruct with options used
     """
 
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_kdvv_func = fnft_clib.fnft_kdvv
-    clib_kdvv_func.restype = ctypes_int
-    kdvv_D = ctypes_uint(D)
-    kdvv_u = np.zeros(kdvv_D.value, dtype=numpy_complex)
-    kdvv_u[:] = u[:] + 0.0j
-    kdvv_T = np.zeros(2, dtype=numpy_double)
-    kdvv_T[0] = T1
-    kdvv_T[1] = T2
-    kdvv_M = ctypes_uint(M)
-    kdvv_cont = np.zeros(M, dtype=numpy_complex)
-    kdvv_Xi = np.zeros(2, dtype=numpy_double)
-    kdvv_Xi[0] = Xi1
-    kdvv_Xi[1] = Xi2
-    # kdvv_k = ctypes_uint(k)
-    # bound states -> will stay empty until implemented
-    # kdvv_boundstates = np.zeros(k,dtype=numpy_complex)
-    # discrete spectrum -> will stay empty until implemented
-    # kdvv_discspec = np.zeros(k,dtype=numpy_complex)
-    clib_kdvv_func.argtypes = [
-        type(kdvv_D),  # D
-        numpy_complex_arr_ptr,  # u
-        numpy_double_arr_ptr,  # t
-        type(kdvv_M),  # M
-        numpy_complex_arr_ptr,  # cont
-        numpy_double_arr_ptr,  # Xi
-        type(ctypes_nullptr),  # K_ptr
-        type(ctypes_nullptr),  # boundstates
-        type(ctypes_nullptr),  # normconsts res
-        ctypes.POINTER(KdvvOptionsStruct)]  # options ptr
+    clib_kdvv_func = _get_kdvv_func()
+    kdvv_u = prepare_input_array(u, D)
+    kdvv_T = np.asarray([T1, T2], dtype=numpy_double)
+    kdvv_cont = prepare_output_array(out, M)
+    kdvv_Xi = np.asarray([Xi1, Xi2], dtype=numpy_double)
     rv = clib_kdvv_func(
-        kdvv_D,
+        D,
         kdvv_u,
         kdvv_T,
-        kdvv_M,
+        M,
         kdvv_cont,
         kdvv_Xi,
         ctypes_nullptr,
@@ -165,5 +279,5 @@ def kdvv_wrapper(D, u, T1, T2, M, Xi1, Xi2,
         ctypes_nullptr,
         ctypes.byref(options))
     check_return_code(rv)
-    rdict = {'return_value': rv, 'cont': kdvv_cont, 'options': repr(options)}
+    rdict = {'return_value': rv, 'cont': kdvv_cont, 'options': options}
     return rdict
@@ -28,7 +28,7 @@ Christoph Mahnke, 2018
 """
 
 from .typesdef import *
-from .auxiliary import get_lib_path, check_return_code
+from .auxiliary import get_fnft_clib, check_return_code, prepare_input_array
 from .options_handling import print_nsep_options, get_nsep_options
 
 
@@ -147,15 +147,12 @@ def nsep_wrapper(D, q, T1, T2, kappa,
 
     """
 
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_nsep_func = fnft_clib.fnft_nsep
+    fnft_clib = get_fnft_clib()
+    clib_nsep_func = fnft_clib['fnft_nsep']
     clib_nsep_func.restype = ctypes_int
     nsep_D = ctypes_uint(D)
-    nsep_q = np.zeros(nsep_D.value, dtype=numpy_complex)
-    nsep_q[:] = q[:] + 0.0j
-    nsep_T = np.zeros(2, dtype=numpy_double)
-    nsep_T[0] = T1
-    nsep_T[1] = T2
+    nsep_q = prepare_input_array(q, nsep_D.value)
+    nsep_T = np.asarray([T1, T2], dtype=numpy_double)
     nsep_K = ctypes_uint(4 * nsep_D.value)
     nsep_main_spec = np.zeros(nsep_K.value, dtype=numpy_complex)
     nsep_M = ctypes_uint(2 * nsep_D.value)
@@ -147,8 +147,8 @@ def nsev_inverse_wrapper(M, contspec, Xi1, Xi2, K, bound_states,
         * q : time field resulting from inverse transform
         * options : options for nsev_inverse as NsevInverseOptionsStruct
     """
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_nsev_inverse_func = fnft_clib.fnft_nsev_inverse
+    fnft_clib = get_fnft_clib()
+    clib_nsev_inverse_func = fnft_clib['fnft_nsev_inverse']
     clib_nsev_inverse_func.restype = ctypes_int
     nsev_M = ctypes_uint(M)
     nsev_Xi = np.zeros(2, dtype=numpy_double)
@@ -259,8 +259,8 @@ def nsev_inverse_xi_wrapper(D, T1, T2, M, dis=None):
     * xi : two-element C double vector containing XI borders
 
     """
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_nsev_inverse_xi_func = fnft_clib.fnft_nsev_inverse_XI
+    fnft_clib = get_fnft_clib()
+    clib_nsev_inverse_xi_func = fnft_clib['fnft_nsev_inverse_XI']
     clib_nsev_inverse_xi_func.restype = ctypes_int
     nsev_D = ctypes_uint(D)
     nsev_T = np.zeros(2, dtype=numpy_double)
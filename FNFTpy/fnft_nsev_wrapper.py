@@ -28,12 +28,12 @@ Christoph Mahnke, Shrinivas Chimmalgi 2018
 """
 
 from .typesdef import *
-from .auxiliary import get_lib_path, check_return_code
+from .auxiliary import get_fnft_clib, check_return_code, prepare_input_array, prepare_output_array
 from .options_handling import get_nsev_options
 
 
 def nsev(q, tvec, Xi1=-2, Xi2=2, M=128, K=128, kappa=1, bsf=None,
-         bsl=None, niter=None, Dsub=None, dst=None, cst=None, nf=None, dis=None):
+         bsl=None, niter=None, Dsub=None, dst=None, cst=None, nf=None, dis=None, out=None):
     """Calculate the Nonlinear Fourier Transform for the Nonlinear Schroedinger equation with vanishing boundaries.
 
     This function is intended to be 'convenient', which means it
@@ -113,6 +113,11 @@ def nsev(q, tvec, Xi1=-2, Xi2=2, M=128, K=128, kappa=1, bsf=None,
         * 0 = off
         * 1 = on
 
+    * out : complex numpy array to store the continuous spectrum in, default = None (allocate new array)
+
+        * length M for cst = 0, 2*M for cst = 1, 3*M for cst = 2
+        * not used when the continuous spectrum is skipped
+
     Returns:
 
     * rdict : dictionary holding the fields (depending on options)
@@ -133,11 +138,11 @@ def nsev(q, tvec, Xi1=-2, Xi2=2, M=128, K=128, kappa=1, bsf=None,
     T2 = np.max(tvec)
     options = get_nsev_options(bsf=bsf, bsl=bsl, niter=niter, Dsub=Dsub, dst=dst, cst=cst, nf=nf, dis=dis)
     return nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
-                        M, K, kappa, options)
+                        M, K, kappa, options, out=out)
 
 
 def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
-                 M, K, kappa, options):
+                 M, K, kappa, options, out=None):
     """Calculate the Nonlinear Fourier Transform for the Nonlinear Schroedinger equation with vanishing boundaries.
 
     This function's interface mimics the behavior of the function 'fnft_nsev' of FNFT.
@@ -147,7 +152,8 @@ def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
     Arguments:
 
     * D : number of sample points
-    * q : numpy array holding the samples of the field to be analyzed
+    * q : numpy array holding the samples of the field to be analyzed.
+      A C-contiguous complex128 array is passed to FNFT without copying.
     * T1, T2 : time positions of the first and the last sample
     * Xi1, Xi2 : min and max frequency for the continuous spectrum
     * M : number of values for the continuous spectrum to calculate
@@ -155,6 +161,11 @@ def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
     * kappa : +/- 1 for focussing/defocussing nonlinearity
     * options : options for nsev as NsevOptionsStruct
 
+    Optional arguments:
+
+    * out : C-contiguous complex numpy array to store the continuous spectrum in.
+      Its length has to be M, 2*M or 3*M depending on options.contspec_type.
+      Reusing the same array avoids an allocation per call. default = None (allocate new array)
 
     Returns:
 
@@ -172,8 +183,8 @@ def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
 
     """
 
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_nsev_func = fnft_clib.fnft_nsev
+    fnft_clib = get_fnft_clib()
+    clib_nsev_func = fnft_clib['fnft_nsev']
     clib_nsev_func.restype = ctypes_int
     nsev_D = ctypes_uint(D)
     nsev_M = ctypes_uint(M)
@@ -181,8 +192,7 @@ def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
     nsev_T = np.zeros(2, dtype=numpy_double)
     nsev_T[0] = T1
     nsev_T[1] = T2
-    nsev_q = np.zeros(nsev_D.value, dtype=numpy_complex)
-    nsev_q[:] = q[:] + 0.0j
+    nsev_q = prepare_input_array(q, nsev_D.value)
     nsev_kappa = ctypes_int(kappa)
     nsev_Xi = np.zeros(2, dtype=numpy_double)
     nsev_Xi[0] = Xi1
@@ -209,17 +219,16 @@ def nsev_wrapper(D, q, T1, T2, Xi1, Xi2,
     #
     # continuous spectrum -> reflection coefficient and / or a,b
     #
-    nsev_cont_spec_type = np.ctypeslib.ndpointer(dtype=numpy_complex,
-                                                 ndim=1, flags='C')
+    nsev_cont_spec_type = numpy_complex_arr_ptr
     if options.contspec_type == 0:
         # reflection coeff.
-        nsev_cont = np.zeros(M, dtype=numpy_complex)
+        nsev_cont = prepare_output_array(out, M)
     elif options.contspec_type == 1:
         # a and b
-        nsev_cont = np.zeros(2 * M, dtype=numpy_complex)
+        nsev_cont = prepare_output_array(out, 2 * M)
     elif options.contspec_type == 2:
         # a and b AND reflection coeff.
-        nsev_cont = np.zeros(3 * M, dtype=numpy_complex)
+        nsev_cont = prepare_output_array(out, 3 * M)
     else:
         # 3 or any other option: skip continuous spectrum -> pass NULL
         nsev_cont = ctypes_nullptr
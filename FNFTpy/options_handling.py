@@ -27,7 +27,7 @@ Christoph Mahnke, Shrinivas Chimmalgi, 2018
 
 """
 
-from .auxiliary import get_lib_path
+from .auxiliary import get_fnft_clib
 from .typesdef import *
 
 
@@ -43,8 +43,8 @@ def fnft_kdvv_default_options_wrapper():
     * options : KdvvOptionsStruct with options for kdvv_wrapper
 
     """
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_func = fnft_clib.fnft_kdvv_default_opts
+    fnft_clib = get_fnft_clib()
+    clib_func = fnft_clib['fnft_kdvv_default_opts']
     clib_func.restype = KdvvOptionsStruct
     clib_func.argtpes = []
     return clib_func()
@@ -117,8 +117,8 @@ def fnft_nsep_default_options_wrapper():
     * options : NsepOptionsStruct for nsep_wrapper
 
     """
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_func = fnft_clib.fnft_nsep_default_opts
+    fnft_clib = get_fnft_clib()
+    clib_func = fnft_clib['fnft_nsep_default_opts']
     clib_func.restype = NsepOptionsStruct
     clib_func.argtpes = []
     return clib_func()
@@ -227,8 +227,8 @@ def fnft_nsev_default_options_wrapper():
 
     """
 
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_func = fnft_clib.fnft_nsev_default_opts
+    fnft_clib = get_fnft_clib()
+    clib_func = fnft_clib['fnft_nsev_default_opts']
     clib_func.restype = NsevOptionsStruct
     clib_func.argtpes = []
     return clib_func()
@@ -348,8 +348,8 @@ def fnft_nsev_inverse_default_options_wrapper():
 
     """
 
-    fnft_clib = ctypes.CDLL(get_lib_path())
-    clib_func = fnft_clib.fnft_nsev_inverse_default_opts
+    fnft_clib = get_fnft_clib()
+    clib_func = fnft_clib['fnft_nsev_inverse_default_opts']
     clib_func.restype = NsevInverseOptionsStruct
     clib_func.argtpes = []
     return clib_func()
@@ -28,14 +28,15 @@ Christoph Mahnke, 2018
 """
 
 import unittest
-from testfunctions import KdvvExampleTest, NsepExampleTest, NsevExampleTest, \
+from testfunctions import KdvvExampleTest, KdvvOutputTest, NsepExampleTest, NsevExampleTest, \
     NsevDstCstInputTest, NsevInverseExample, NsevInverseExample2, \
     NsevInverseInputVariation, FnftpyOptionsTest
 from FNFTpy import print_fnft_version
 
 options_suite = unittest.TestLoader().loadTestsFromTestCase(FnftpyOptionsTest)
 
-kdvv_suite = unittest.TestLoader().loadTestsFromTestCase(KdvvExampleTest)
+kdvv_suite1 = unittest.TestLoader().loadTestsFromTestCase(KdvvExampleTest)
+kdvv_suite2 = unittest.TestLoader().loadTestsFromTestCase(KdvvOutputTest)
 
 nsep_suite = unittest.TestLoader().loadTestsFromTestCase(NsepExampleTest)
 
@@ -47,7 +48,7 @@ nsev_inverse_suite2 = unittest.TestLoader().loadTestsFromTestCase(NsevInverseExa
 nsev_inverse_suite3 = unittest.TestLoader().loadTestsFromTestCase(NsevInverseInputVariation)
 
 suite = unittest.TestSuite([options_suite,
-                            kdvv_suite,
+                            kdvv_suite1, kdvv_suite2,
                             nsep_suite,
                             nsev_suite1, nsev_suite2,
                             nsev_inverse_suite1,
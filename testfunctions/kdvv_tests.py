@@ -31,6 +31,15 @@ import unittest
 
 from .array_test import *
 from examples import kdvv_example
+from FNFTpy import kdvv, kdvv_batch, kdvv_parallel, kdvv_wrapper, get_kdvv_options
+
+
+# continuous spectrum expected for kdvv_example
+expected_example_cont = np.array([
+    0.15329981 + 0.12203649j, 0.24385425 + 0.09606438j,
+    0.12418466 - 0.00838456j, -0.46324501 + 0.20526334j,
+    -0.46324501 - 0.20526334j, 0.12418466 + 0.00838456j,
+    0.24385425 - 0.09606438j, 0.15329981 - 0.12203649j])
 
 
 class KdvvExampleTest(unittest.TestCase):
@@ -38,14 +47,74 @@ class KdvvExampleTest(unittest.TestCase):
 
     def setUp(self):
         self.res = kdvv_example()
+        self.expected = {'cont': expected_example_cont}
 
     def test_kdvv_example(self):
         with self.subTest('check FNFT kdvv return value'):
             self.assertEqual(self.res['return_value'], 0, "FNFT kdvv return value")
-        expected = {'cont': np.array([
-            0.15329981 + 0.12203649j, 0.24385425 + 0.09606438j,
-            0.12418466 - 0.00838456j, -0.46324501 + 0.20526334j,
-            -0.46324501 - 0.20526334j, 0.12418466 + 0.00838456j,
-            0.24385425 - 0.09606438j, 0.15329981 - 0.12203649j])}
         with self.subTest('check contspec'):
-            self.assertTrue(check_array(self.res['cont'], expected['cont']), 'contspec as expected')
+            self.assertTrue(check_array(self.res['cont'], self.expected['cont']), 'contspec as expected')
+
+
+class KdvvOutputTest(unittest.TestCase):
+    """Testcase for output buffers and multiple signals for kdvv."""
+
+    @classmethod
+    def setUpClass(cls):
+        # same field as in kdvv_example
+        cls.D = 256
+        cls.M = 8
+        cls.tvec = np.linspace(-1, 1, cls.D)
+        cls.q = np.zeros(cls.D, dtype=np.complex128)
+        cls.q[:] = 2.0 + 0.0j
+        cls.expected = {'cont': expected_example_cont}
+        # several fields with different amplitudes, one per row
+        cls.us = np.zeros((3, cls.D), dtype=np.complex128)
+        cls.us[:, :] = np.array([[2.0], [1.5], [0.5]])
+
+    def test_kdvv_out(self):
+        cont_buf = np.empty(self.M, dtype=np.complex128)
+        res = kdvv(self.q, self.tvec, self.M, Xi1=-2, Xi2=2, out=cont_buf)
+        with self.subTest('output array is reused'):
+            self.assertTrue(res['cont'] is cont_buf, "output array not reused")
+        with self.subTest('check contspec'):
+            self.assertTrue(check_array(cont_buf, self.expected['cont']), 'contspec as expected')
+        with self.subTest('wrong output size'):
+            with self.assertRaises(ValueError):
+                kdvv(self.q, self.tvec, self.M, out=np.empty(4, dtype=np.complex128))
+        with self.subTest('read-only output array'):
+            cont_ro = np.empty(self.M, dtype=np.complex128)
+            cont_ro.flags['WRITEABLE'] = False
+            with self.assertRaises(ValueError):
+                kdvv(self.q, self.tvec, self.M, out=cont_ro)
+        with self.subTest('input length not matching D'):
+            with self.assertRaises(ValueError):
+                kdvv_wrapper(self.D + 1, self.q, -1.0, 1.0, self.M, -2, 2, 0, get_kdvv_options())
+
+    def test_kdvv_batch(self):
+        res = kdvv_batch(self.us, self.tvec, self.M, Xi1=-2, Xi2=2)
+        with self.subTest('check FNFT kdvv return values'):
+            self.assertTrue((res['return_value'] == 0).all(), "FNFT kdvv return value")
+        for i in range(len(self.us)):
+            with self.subTest('check contspec', signal=i):
+                single = kdvv(self.us[i], self.tvec, self.M, Xi1=-2, Xi2=2)
+                self.assertTrue(check_array(res['cont'][i], single['cont']), 'contspec as for single call')
+        with self.subTest('output array is reused'):
+            cont_buf = np.empty((len(self.us), self.M), dtype=np.complex128)
+            res_out = kdvv_batch(self.us, self.tvec, self.M, Xi1=-2, Xi2=2, out=cont_buf)
+            self.assertTrue(res_out['cont'] is cont_buf, "output array not reused")
+            self.assertTrue(check_array(cont_buf, res['cont']), 'contspec as without out')
+        with self.subTest('wrong output shape'):
+            with self.assertRaises(ValueError):
+                kdvv_batch(self.us, self.tvec, self.M, out=np.empty((len(self.us), self.M + 1), dtype=np.complex128))
+        with self.subTest('1-d input'):
+            with self.assertRaises(ValueError):
+                kdvv_batch(self.q, self.tvec, self.M)
+
+    def test_kdvv_parallel(self):
+        res = kdvv_parallel(self.us, self.tvec, self.M, Xi1=-2, Xi2=2, n_workers=2)
+        expected = kdvv_batch(self.us, self.tvec, self.M, Xi1=-2, Xi2=2)
+        with self.subTest('check FNFT kdvv return values'):
+            self.assertTrue((res['return_value'] == 0).all(), "FNFT kdvv return value")
+        with self.subTest('check contspec'):
+            self.assertTrue(check_array(res['cont'], expected['cont']), 'contspec as for kdvv_batch')
@@ -66,49 +66,70 @@ class NsevExampleTest(unittest.TestCase):
 class NsevDstCstInputTest(unittest.TestCase):
     """Testcase for various input for nsev."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         D = 256
-        tvec = np.linspace(-1, 1, D)
-        q = np.zeros(len(tvec), dtype=np.complex128)
-        q[:] = 2.3 / np.cosh(tvec)
-        res = {}
+        cls.tvec = np.linspace(-1, 1, D)
+        cls.q = np.zeros(len(cls.tvec), dtype=np.complex128)
+        cls.q[:] = 2.3 / np.cosh(cls.tvec)
+        # one buffer for the continuous spectrum, reused by all calls
+        cls.M = 128
+        cls.cont_buf = np.empty(3 * cls.M, dtype=np.complex128)
+
+    def cont_out(self, cst=0):
+        """Return a slice of the shared buffer of the length needed for given cst."""
+        cont_len = {0: self.M, 1: 2 * self.M, 2: 3 * self.M}
+        return self.cont_buf[0:cont_len.get(cst, self.M)]
+
+    def test_dst_cst_variation(self):
         # different switches for discrete spectrum type
-        for dst in [-1, 0, 1, 2, 3]:
-            tmpres = nsev(q, tvec, dst=dst, )
-            res['dst=%d' % dst] = np.array([tmpres['return_value'] == 0,
-                                            'disc_res' in tmpres.keys(),
-                                            'disc_norm' in tmpres.keys()])
+        expected_dst = {-1: np.array([True, False, False]),
+                        0: np.array([True, False, True]),
+                        1: np.array([True, True, False]),
+                        2: np.array([True, True, True]),
+                        3: np.array([True, False, False])}
+        for dst in expected_dst.keys():
+            with self.subTest(dst=dst):
+                tmpres = nsev(self.q, self.tvec, M=self.M, dst=dst, out=self.cont_out())
+                res = np.array([tmpres['return_value'] == 0,
+                                'disc_res' in tmpres.keys(),
+                                'disc_norm' in tmpres.keys()])
+                self.assertTrue(check_boolarray(res, expected_dst[dst]), "unexpected output")
         # different switches for continuous spectrum type
-        for cst in [-1, 0, 1, 2, 3]:
-            tmpres = nsev(q, tvec, cst=cst, )
-            res['cst=%d' % cst] = np.array([
-                tmpres['return_value'] == 0,
-                'cont_ref' in tmpres.keys(),
-                'cont_a' in tmpres.keys(),
-                'cont_b' in tmpres.keys()])
+        expected_cst = {-1: np.array([True, False, False, False]),
+                        0: np.array([True, True, False, False]),
+                        1: np.array([True, False, True, True]),
+                        2: np.array([True, True, True, True]),
+                        3: np.array([True, False, False, False])}
+        for cst in expected_cst.keys():
+            with self.subTest(cst=cst):
+                tmpres = nsev(self.q, self.tvec, M=self.M, cst=cst, out=self.cont_out(cst))
+                res = np.array([tmpres['return_value'] == 0,
+                                'cont_ref' in tmpres.keys(),
+                                'cont_a' in tmpres.keys(),
+                                'cont_b' in tmpres.keys()])
+                self.assertTrue(check_boolarray(res, expected_cst[cst]), "unexpected output")
         # calulate neither discrete nor continuous spectrum
-        tmpres = nsev(q, tvec, dst=3, cst=3)
-        res['dst=3cst=3'] = np.array([tmpres['return_value'] == 0,
-                                      'disc_res' in tmpres.keys(),
-                                      'disc_norm' in tmpres.keys(),
-                                      'cont_ref' in tmpres.keys(),
-                                      'cont_a' in tmpres.keys(),
-                                      'cont_b' in tmpres.keys()
-                                      ])
-        self.res = res
-
-    def test_dst_cst_variation(self):
-        expected = {'dst=-1': np.array([True, False, False]),
-                    'dst=0': np.array([True, False, True]),
-                    'dst=1': np.array([True, True, False]),
-                    'dst=2': np.array([True, True, True]),
-                    'dst=3': np.array([True, False, False]),
-                    'cst=-1': np.array([True, False, False, False]),
-                    'cst=0': np.array([True, True, False, False]),
-                    'cst=1': np.array([True, False, True, True]),
-                    'cst=2': np.array([True, True, True, True]),
-                    'cst=3': np.array([True, False, False, False]),
-                    'dst=3cst=3': np.array([True, False, False, False, False, False])}
-        for k in expected.keys():
-            with self.subTest(key=k):
-                self.assertTrue(check_boolarray(self.res[k], expected[k]), "unexpected output")
+        with self.subTest(dst=3, cst=3):
+            tmpres = nsev(self.q, self.tvec, M=self.M, dst=3, cst=3, out=self.cont_out(3))
+            res = np.array([tmpres['return_value'] == 0,
+                            'disc_res' in tmpres.keys(),
+                            'disc_norm' in tmpres.keys(),
+                            'cont_ref' in tmpres.keys(),
+                            'cont_a' in tmpres.keys(),
+                            'cont_b' in tmpres.keys()])
+            self.assertTrue(check_boolarray(res, np.array([True, False, False, False, False, False])),
+                            "unexpected output")
+
+    def test_cont_out(self):
+        cont_keys = ['cont_ref', 'cont_a', 'cont_b']
+        for cst in [0, 1, 2]:
+            expected = nsev(self.q, self.tvec, M=self.M, cst=cst)
+            res = nsev(self.q, self.tvec, M=self.M, cst=cst, out=self.cont_out(cst))
+            for key in [k for k in cont_keys if k in expected.keys()]:
+                with self.subTest(cst=cst, key=key):
+                    self.assertTrue(np.shares_memory(res[key], self.cont_buf), "output array not used")
+                    self.assertTrue(check_array(res[key], expected[key]), "unexpected output")
+        with self.subTest('wrong output size'):
+            with self.assertRaises(ValueError):
+                nsev(self.q, self.tvec, M=self.M, cst=1, out=self.cont_out(0))